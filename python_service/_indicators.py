@@ -0,0 +1,153 @@
+"""
+Fused technical-indicator kernels
+
+One compiled pass over a price series produces RSI, SMA20/50, EMA12/26,
+MACD and its signal line together, instead of one array walk per
+indicator. Falls back to scipy's lfilter for the EMA recurrence (and the
+unfused NumPy path in main) when numba is not installed.
+"""
+
+import numpy as np
+
+from _bs_kernels import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(cache=True)
+def ema_series(arr: np.ndarray, span: int) -> np.ndarray:
+    """EMA recurrence over the full series (pandas ewm(adjust=False) semantics)"""
+    alpha = 2.0 / (span + 1.0)
+    out = np.empty_like(arr)
+    out[0] = arr[0]
+    for i in range(1, arr.shape[0]):
+        out[i] = alpha * arr[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@njit(cache=True)
+def rsi_last(arr: np.ndarray, period: int) -> float:
+    """RSI from the simple mean of gains/losses over the last `period` deltas"""
+    gain = 0.0
+    loss = 0.0
+    n = arr.shape[0]
+    for i in range(n - period, n):
+        delta = arr[i] - arr[i - 1]
+        if delta > 0.0:
+            gain += delta
+        else:
+            loss -= delta
+    if loss == 0.0:
+        # Flat window (no gains either) is neutral, not overbought
+        if gain == 0.0:
+            return 50.0
+        return 100.0
+    rs = gain / loss
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+def _ema_series_lfilter(arr: np.ndarray, span: int) -> np.ndarray:
+    """EMA via scipy.signal.lfilter: same recurrence as ema_series but run
+    as a single C filter pass, used when numba is not installed"""
+    from scipy.signal import lfilter
+    alpha = 2.0 / (span + 1.0)
+    zi = np.array([arr[0] * (1.0 - alpha)])
+    return lfilter([alpha], [1.0, alpha - 1.0], arr, zi=zi)[0]
+
+
+def _rsi_last_np(arr: np.ndarray, period: int) -> float:
+    """Vectorized rsi_last used when the compiled loop is unavailable"""
+    deltas = np.diff(arr[-(period + 1):])
+    gain = np.maximum(deltas, 0.0).sum()
+    loss = np.maximum(-deltas, 0.0).sum()
+    if loss == 0.0:
+        return 50.0 if gain == 0.0 else 100.0
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+# Without numba the @njit decorators are no-ops and the loops would run
+# interpreted; route them through lfilter / vectorized NumPy instead
+if not NUMBA_AVAILABLE:
+    ema_series = _ema_series_lfilter
+    rsi_last = _rsi_last_np
+
+
+@njit(cache=True, fastmath=True)
+def indicators_last(arr: np.ndarray):
+    """All indicator endpoints from one fused pass over the series.
+
+    Runs the three EMA recurrences in one comparison-free loop, then sums
+    the trailing 14/20/50 windows over their slices directly (the window
+    bounds are loop-invariant, so no per-element range checks); returns
+    (rsi, macd, macd_signal, sma_20, sma_50, ema_12, ema_26) matching the
+    per-indicator kernels exactly.
+    """
+    n = arr.shape[0]
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+
+    ema_12 = arr[0]
+    ema_26 = arr[0]
+    macd = 0.0
+    signal = 0.0
+
+    for i in range(1, n):
+        x = arr[i]
+        ema_12 = a12 * x + (1.0 - a12) * ema_12
+        ema_26 = a26 * x + (1.0 - a26) * ema_26
+        macd = ema_12 - ema_26
+        signal = a9 * macd + (1.0 - a9) * signal
+
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - 14, n):
+        delta = arr[i] - arr[i - 1]
+        if delta > 0.0:
+            gain += delta
+        else:
+            loss -= delta
+
+    s20 = arr[n - 20:].sum()
+    s50 = arr[n - 50:].sum() if n > 50 else arr.sum()
+
+    if loss == 0.0:
+        # Flat window (no gains either) is neutral, not overbought
+        if gain == 0.0:
+            rsi = 50.0
+        else:
+            rsi = 100.0
+    else:
+        rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+
+    sma_20 = s20 / 20.0
+    sma_50 = s50 / (n if n < 50 else 50)
+    return rsi, macd, signal, sma_20, sma_50, ema_12, ema_26
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def indicators_batch(prices_2d: np.ndarray) -> np.ndarray:
+    """Fused indicators for many series at once, parallel across rows.
+
+    Returns an (n_series, 7) array with the same column order as
+    indicators_last: rsi, macd, macd_signal, sma_20, sma_50, ema_12,
+    ema_26.
+    """
+    n = prices_2d.shape[0]
+    out = np.empty((n, 7))
+    for i in prange(n):
+        rsi, macd, signal, sma_20, sma_50, ema_12, ema_26 = indicators_last(prices_2d[i])
+        out[i, 0] = rsi
+        out[i, 1] = macd
+        out[i, 2] = signal
+        out[i, 3] = sma_20
+        out[i, 4] = sma_50
+        out[i, 5] = ema_12
+        out[i, 6] = ema_26
+    return out
+
+
+# Warm the JIT at import (same pattern as _bs_kernels)
+if NUMBA_AVAILABLE:
+    ema_series(np.zeros(30), 12)
+    rsi_last(np.zeros(30), 14)
+    indicators_last(np.zeros(50))
+    indicators_batch(np.zeros((2, 50)))
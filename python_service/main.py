@@ -3,19 +3,31 @@ FastAPI Market Data Processing Service
 Advanced market data processing, iron condor strategy analysis, and options analytics
 """
 
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any, Tuple
-import random
+from typing import Annotated, List, Dict, Optional, Any, Tuple
+import asyncio
+import hashlib
+import math
+import os
 import time
-from datetime import datetime, timedelta
-import pandas as pd
+import msgspec
+import orjson
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from functools import lru_cache
+from datetime import datetime
 import numpy as np
-from scipy import stats
-from scipy.optimize import minimize_scalar
+from scipy.special import ndtr, ndtri
 import logging
 
+from _bs_kernels import (NUMBA_AVAILABLE, bs_price, bs_greeks,
+                         ic_payoff_scalar, ic_payoff_vec)
+from _indicators import ema_series, rsi_last, indicators_last, indicators_batch
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,7 +35,10 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Market Data Processing Service",
     description="Python FastAPI service for market data processing, iron condor strategy, and options analytics",
-    version="2.0.0"
+    version="2.0.0",
+    # orjson serializes the float-heavy analysis payloads in C and handles
+    # numpy scalars natively, ~3-5x faster than the stdlib json default
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -37,11 +52,14 @@ app.add_middleware(
 
 # ==================== Data Models ====================
 
-class MarketDataRequest(BaseModel):
+# Request bodies on the polling-hot endpoints (market-data, analyze) are
+# msgspec Structs decoded by a generated C routine; see the iron condor
+# models below for the same split.
+class MarketDataRequest(msgspec.Struct):
     symbols: List[str]
-    timeframe: Optional[str] = "1m"
-    
-class Position(BaseModel):
+    timeframe: str = "1m"
+
+class Position(msgspec.Struct):
     position_id: str
     symbol: str
     position_type: str
@@ -52,7 +70,7 @@ class Position(BaseModel):
     commission: float
     open_time: str
 
-class EquityData(BaseModel):
+class EquityData(msgspec.Struct):
     broker: str
     equity_balance: float
     cash_balance: float
@@ -62,16 +80,32 @@ class EquityData(BaseModel):
     timestamp: str
 
 # Iron Condor Models
-class IronCondorAnalysisRequest(BaseModel):
+#
+# The two hottest request bodies (analyze, batch-update) are msgspec
+# Structs decoded by a generated C routine, which validates roughly an
+# order of magnitude faster than BaseModel; the rest stay on pydantic.
+class IronCondorAnalysisRequest(msgspec.Struct):
     symbol: str
     expiration_date: str
     long_call_strike: float
     short_call_strike: float
     short_put_strike: float
     long_put_strike: float
-    contracts: int = Field(default=1, gt=0)
+    contracts: Annotated[int, msgspec.Meta(gt=0)] = 1
     current_price: Optional[float] = None
-    implied_volatility: Optional[float] = Field(default=0.20, gt=0, le=2.0)
+    implied_volatility: Annotated[float, msgspec.Meta(gt=0, le=2.0)] = 0.20
+    risk_free_rate: Annotated[float, msgspec.Meta(ge=0, le=0.20)] = 0.05
+
+class IronCondorBatchAnalysisRequest(BaseModel):
+    symbol: str
+    expiration_date: str
+    long_call_strike: float
+    short_call_strike: float
+    short_put_strike: float
+    long_put_strike: float
+    contracts: int = Field(default=1, gt=0)
+    current_prices: List[float]
+    implied_volatilities: List[float]
     risk_free_rate: Optional[float] = Field(default=0.05, ge=0, le=0.20)
 
 class IronCondorGreeksRequest(BaseModel):
@@ -98,132 +132,441 @@ class PositionMonitorRequest(BaseModel):
     contracts: int
     entry_credit: float
 
-class RealTimeUpdateRequest(BaseModel):
+class PayoffCurveRequest(BaseModel):
+    strikes: Dict[str, float]  # long_call, short_call, short_put, long_put
+    net_credit: float
+    prices: Optional[List[float]] = None
+    points: int = Field(default=200, gt=1, le=10000)
+
+class RealTimeUpdateRequest(msgspec.Struct):
     positions: List[Dict[str, Any]]
     market_data: Dict[str, float]
 
+# One pre-built decoder per hot request type
+_MARKET_DATA_DECODER = msgspec.json.Decoder(MarketDataRequest)
+_ANALYZE_DECODER = msgspec.json.Decoder(IronCondorAnalysisRequest)
+_BATCH_UPDATE_DECODER = msgspec.json.Decoder(RealTimeUpdateRequest)
+
+async def _decode_body(request: Request, decoder: msgspec.json.Decoder):
+    """Decode and validate a request body with msgspec.
+
+    msgspec.ValidationError maps to the 422 FastAPI would raise for a
+    pydantic failure; malformed JSON maps to 400.
+    """
+    try:
+        return decoder.decode(await request.body())
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Malformed JSON: {str(e)}")
+
 # ==================== Helper Functions ====================
 
-def generate_market_price(symbol: str) -> Dict[str, Any]:
-    """Generate realistic market price data for a given symbol"""
-    base_prices = {
-        "US30": 42500.0,
-        "SPX": 4500.0,
-        "AAPL": 175.0,
-        "GOOGL": 140.0,
-        "MSFT": 340.0,
-        "TSLA": 250.0,
-        "EURUSD": 1.0850,
-        "GBPUSD": 1.2650,
-    }
-    
-    base_price = base_prices.get(symbol, 100.0 + random.random() * 900.0)
-    change = (random.random() - 0.5) * base_price * 0.02
+# Cache for _now_iso: [last refresh time.monotonic_ns(), formatted string]
+_NOW_CACHE = [0, ""]
+# Wider than the 5 ms background tick (see _refresh_now_loop) so handlers
+# always hit the cache while the app is running
+_NOW_TTL_NS = 10_000_000  # 10 ms
+
+def _now_iso() -> str:
+    """Current time as an ISO string for response envelopes.
+
+    datetime.now().isoformat() costs ~1.5us per call; envelope timestamps
+    only need millisecond precision. While the app runs, a background
+    task refreshes the cache every 5 ms and this is a plain list read;
+    the TTL check (monotonic clock, immune to wall-clock jumps) is the
+    fallback for contexts without the task, e.g. process-pool workers.
+    """
+    ns = time.monotonic_ns()
+    if ns - _NOW_CACHE[0] > _NOW_TTL_NS:
+        _NOW_CACHE[0] = ns
+        _NOW_CACHE[1] = datetime.now().isoformat()
+    return _NOW_CACHE[1]
+
+# Shared numpy generator: one vectorized draw replaces dozens of
+# random.random() interpreter round-trips per request. SFC64 is the
+# fastest bit generator numpy ships and this is simulation noise, not
+# cryptography, so raw throughput wins over PCG64's statistical margin.
+_rng = np.random.Generator(np.random.SFC64())
+
+# Reference prices for known symbols, hoisted to module scope so the dict is
+# not rebuilt on every generate_market_price call; the proxy keeps handler
+# code from mutating shared reference data
+BASE_PRICES = MappingProxyType({
+    "US30": 42500.0,
+    "SPX": 4500.0,
+    "AAPL": 175.0,
+    "GOOGL": 140.0,
+    "MSFT": 340.0,
+    "TSLA": 250.0,
+    "EURUSD": 1.0850,
+    "GBPUSD": 1.2650,
+})
+
+# Constant bid/ask spread multipliers shared by the scalar and bulk price
+# generators
+_BID_MULT = 0.9995
+_ASK_MULT = 1.0005
+
+# Signal labels indexed by int(cp > -0.5) + int(cp > 0.5); shared by the
+# scalar and batched sentiment paths
+_SENTIMENT_SIGNALS = ("bearish", "neutral", "bullish")
+
+# Synthetic history uses small-variance normal returns (more realistic
+# than the old uniform +/-0.5% draw); sigma matches the uniform draw's
+# standard deviation of 0.01/sqrt(12) so indicator magnitudes are
+# unchanged
+_HIST_NOISE_STD = 0.01 / math.sqrt(12.0)
+
+def generate_market_price(symbol: str, timestamp: Optional[str] = None,
+                          noise: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """Generate realistic market price data for a given symbol.
+
+    `noise` is a pre-drawn uniform[0,1) 3-vector (base, change, volume);
+    batch callers draw one (n_symbols, 3) block instead of 3N scalar calls.
+    """
+    if noise is None:
+        noise = _rng.random(3)
+    base_price = BASE_PRICES.get(symbol, 100.0 + noise[0] * 900.0)
+    change = (noise[1] - 0.5) * base_price * 0.02
     change_percent = (change / base_price) * 100
-    
+
+    # One fused rounding pass over the price fields instead of seven
+    # Python-level round() dispatches
+    spread = abs(change) * 1.5
+    last, bid, ask, high, low, open_, change = np.array(
+        [base_price, base_price * _BID_MULT, base_price * _ASK_MULT,
+         base_price + spread, base_price - spread, base_price - change,
+         change]).round(4).tolist()
+
     return {
         "symbol": symbol,
-        "last": round(base_price, 4),
-        "bid": round(base_price * 0.9995, 4),
-        "ask": round(base_price * 1.0005, 4),
-        "high": round(base_price + abs(change) * 1.5, 4),
-        "low": round(base_price - abs(change) * 1.5, 4),
-        "open": round(base_price - change, 4),
-        "volume": int(random.random() * 10000 + 5000),
-        "change": round(change, 4),
+        "last": last,
+        "bid": bid,
+        "ask": ask,
+        "high": high,
+        "low": low,
+        "open": open_,
+        "volume": int(noise[2] * 10000 + 5000),
+        "change": change,
         "change_percent": round(change_percent, 2),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": timestamp or _now_iso()
+    }
+
+def generate_market_prices(symbols: List[str], timestamp: Optional[str] = None,
+                           noise: Optional[np.ndarray] = None) -> Dict[str, Dict[str, Any]]:
+    """Bulk price snapshots for many symbols from one vectorized pass.
+
+    Same fields and noise model as generate_market_price, but every price
+    column is computed for all symbols at once: one dict build per symbol
+    is all that remains of the per-symbol cost.
+    """
+    n = len(symbols)
+    if noise is None:
+        noise = _rng.random((n, 3))
+    ts = timestamp or _now_iso()
+
+    # 0.0 marks unknown symbols (real base prices are never zero)
+    base = np.fromiter((BASE_PRICES.get(s, 0.0) for s in symbols),
+                       dtype=np.float64, count=n)
+    base = np.where(base == 0.0, 100.0 + noise[:, 0] * 900.0, base)
+    change = (noise[:, 1] - 0.5) * base * 0.02
+    spread = np.abs(change) * 1.5
+
+    fields = np.round(np.stack(
+        [base, base * _BID_MULT, base * _ASK_MULT,
+         base + spread, base - spread, base - change, change]), 4)
+    change_pct = np.round(change / base * 100, 2)
+    volumes = (noise[:, 2] * 10000 + 5000).astype(np.int64)
+
+    out = {}
+    for i, symbol in enumerate(symbols):
+        last, bid, ask, high, low, open_, chg = fields[:, i].tolist()
+        out[symbol] = {
+            "symbol": symbol,
+            "last": last,
+            "bid": bid,
+            "ask": ask,
+            "high": high,
+            "low": low,
+            "open": open_,
+            "volume": int(volumes[i]),
+            "change": chg,
+            "change_percent": float(change_pct[i]),
+            "timestamp": ts
+        }
+    return out
+
+# Streaming indicator state, keyed by symbol. Once a symbol has been seeded
+# from a full history, subsequent updates are O(1) one-step recurrences
+# instead of an O(N) recompute over the whole window.
+_EMA_STATE: Dict[Tuple[str, int], float] = {}
+_RSI_STATE: Dict[str, Tuple[float, float, float]] = {}  # (avg_gain, avg_loss, last_price)
+_PRICE_WINDOW: Dict[str, deque] = {}
+
+def update_ema(symbol: str, span: int, price: float) -> float:
+    """Apply the one-step EMA recurrence for (symbol, span) and return it"""
+    alpha = 2.0 / (span + 1.0)
+    key = (symbol, span)
+    prev = _EMA_STATE.get(key)
+    ema = price if prev is None else alpha * price + (1.0 - alpha) * prev
+    _EMA_STATE[key] = ema
+    return ema
+
+def update_rsi(symbol: str, price: float, period: int = 14) -> float:
+    """Update Wilder-smoothed RSI state for a symbol and return the RSI"""
+    state = _RSI_STATE.get(symbol)
+    if state is None:
+        _RSI_STATE[symbol] = (0.0, 0.0, price)
+        return 50.0
+
+    avg_gain, avg_loss, last_price = state
+    delta = price - last_price
+    gain = delta if delta > 0 else 0.0
+    loss = -delta if delta < 0 else 0.0
+    avg_gain = (avg_gain * (period - 1) + gain) / period
+    avg_loss = (avg_loss * (period - 1) + loss) / period
+    _RSI_STATE[symbol] = (avg_gain, avg_loss, price)
+
+    if avg_loss == 0.0:
+        # Flat history (no gains either) is neutral, not overbought
+        return 50.0 if avg_gain == 0.0 else 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+def _seed_indicator_state(symbol: str, prices: np.ndarray) -> None:
+    """Seed streaming EMA/RSI state for a symbol from a full price history.
+
+    Callers gate the streaming path on `symbol in _RSI_STATE`, so that
+    key is written last: a concurrent request for the same symbol either
+    sees no state at all (and seeds redundantly but harmlessly) or sees
+    every key populated.
+    """
+    arr = np.asarray(prices, dtype=np.float64)
+    ema_12 = ema_series(arr, 12)
+    ema_26 = ema_series(arr, 26)
+    _EMA_STATE[(symbol, 12)] = float(ema_12[-1])
+    _EMA_STATE[(symbol, 26)] = float(ema_26[-1])
+    _EMA_STATE[(symbol, 9)] = float(ema_series(ema_12 - ema_26, 9)[-1])
+
+    _PRICE_WINDOW[symbol] = deque(prices, maxlen=50)
+
+    deltas = np.diff(arr[-15:])
+    avg_gain = float(np.maximum(deltas, 0.0).mean())
+    avg_loss = float(np.maximum(-deltas, 0.0).mean())
+    _RSI_STATE[symbol] = (avg_gain, avg_loss, float(arr[-1]))
+
+def _update_streaming_indicators(symbol: str, price: float) -> Dict[str, Any]:
+    """O(1) indicator refresh for a symbol with seeded streaming state"""
+    window = _PRICE_WINDOW[symbol]
+    window.append(price)
+    arr = np.asarray(window, dtype=np.float64)
+
+    rsi = update_rsi(symbol, price)
+    ema_12 = update_ema(symbol, 12, price)
+    ema_26 = update_ema(symbol, 26, price)
+    macd = ema_12 - ema_26
+    signal = update_ema(symbol, 9, macd)
+
+    return {
+        "rsi": round(rsi, 2),
+        "macd": round(macd, 4),
+        "macd_signal": round(signal, 4),
+        "sma_20": round(float(arr[-20:].mean()), 4),
+        "sma_50": round(float(arr.mean()), 4),
+        "ema_12": round(ema_12, 4),
+        "ema_26": round(ema_26, 4)
     }
 
-def calculate_technical_indicators(prices: List[float]) -> Dict[str, Any]:
-    """Calculate technical indicators using pandas and numpy"""
+def calculate_technical_indicators(prices) -> Dict[str, Any]:
+    """Calculate technical indicators from a price series (list or ndarray);
+    one fused kernel pass when compiled, memoized on the series bytes.
+
+    Identical series hit the cache: with deterministic production feeds
+    the key is effectively (symbol, bar), so repeated polls within one
+    bar skip the kernel entirely.
+    """
     if len(prices) < 20:
         return {
-            "rsi": round(50.0 + random.random() * 30 - 15, 2),
-            "macd": round((random.random() - 0.5) * 2, 4),
-            "sma_20": sum(prices) / len(prices) if prices else 0,
+            "rsi": round(50.0 + _rng.random() * 30 - 15, 2),
+            "macd": round((_rng.random() - 0.5) * 2, 4),
+            "sma_20": float(sum(prices) / len(prices)) if len(prices) else 0,
         }
-    
-    df = pd.DataFrame({'price': prices})
-    
-    # RSI calculation
-    delta = df['price'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    
-    # Moving averages
-    sma_20 = df['price'].rolling(window=20).mean()
-    sma_50 = df['price'].rolling(window=min(50, len(prices))).mean()
-    ema_12 = df['price'].ewm(span=12, adjust=False).mean()
-    ema_26 = df['price'].ewm(span=26, adjust=False).mean()
-    
-    # MACD
-    macd = ema_12 - ema_26
-    signal = macd.ewm(span=9, adjust=False).mean()
-    
+
+    arr = np.asarray(prices, dtype=np.float64)
+    return dict(_indicators_cached(arr.tobytes()))
+
+@lru_cache(maxsize=4096)
+def _indicators_cached(buf: bytes) -> Dict[str, Any]:
+    """Indicator dict memoized on the raw float64 bytes of the series
+    (ndarrays are unhashable; tobytes costs far less than the kernels)"""
+    arr = np.frombuffer(buf)
+
+    if NUMBA_AVAILABLE:
+        rsi, macd, signal, sma_20, sma_50, ema_12, ema_26 = indicators_last(arr)
+    else:
+        # Unfused NumPy/lfilter path: one pass per indicator
+        rsi = rsi_last(arr, 14)
+        sma_20 = arr[-20:].mean()
+        sma_50 = arr[-min(50, arr.shape[0]):].mean()
+        ema_12_s = ema_series(arr, 12)
+        ema_26_s = ema_series(arr, 26)
+        macd_s = ema_12_s - ema_26_s
+        signal = float(ema_series(macd_s, 9)[-1])
+        macd, ema_12, ema_26 = float(macd_s[-1]), float(ema_12_s[-1]), float(ema_26_s[-1])
+
+    return _indicator_dict(rsi, macd, signal, sma_20, sma_50, ema_12, ema_26)
+
+def _indicator_dict(rsi, macd, signal, sma_20, sma_50, ema_12, ema_26) -> Dict[str, Any]:
+    """Rounded response dict from raw indicator values"""
     return {
-        "rsi": round(float(rsi.iloc[-1]) if not np.isnan(rsi.iloc[-1]) else 50.0, 2),
-        "macd": round(float(macd.iloc[-1]) if not np.isnan(macd.iloc[-1]) else 0.0, 4),
-        "macd_signal": round(float(signal.iloc[-1]) if not np.isnan(signal.iloc[-1]) else 0.0, 4),
-        "sma_20": round(float(sma_20.iloc[-1]) if not np.isnan(sma_20.iloc[-1]) else 0.0, 4),
-        "sma_50": round(float(sma_50.iloc[-1]) if not np.isnan(sma_50.iloc[-1]) else 0.0, 4),
-        "ema_12": round(float(ema_12.iloc[-1]) if not np.isnan(ema_12.iloc[-1]) else 0.0, 4),
-        "ema_26": round(float(ema_26.iloc[-1]) if not np.isnan(ema_26.iloc[-1]) else 0.0, 4)
+        "rsi": round(float(rsi), 2),
+        "macd": round(float(macd), 4),
+        "macd_signal": round(float(signal), 4),
+        "sma_20": round(float(sma_20), 4),
+        "sma_50": round(float(sma_50), 4),
+        "ema_12": round(float(ema_12), 4),
+        "ema_26": round(float(ema_26), 4)
     }
 
 # ==================== Black-Scholes Options Pricing ====================
 
+# Normal pdf constant: 1 / sqrt(2 * pi). Using scipy.special.ndtr for the CDF
+# and an inline pdf avoids the frozen-distribution dispatch overhead of
+# stats.norm.cdf / stats.norm.pdf on every pricing call.
+_INV_SQRT_2PI = 0.3989422804014327
+
+# math.* is ~4x faster than np.* on Python scalars and skips a second
+# attribute lookup; the array paths keep the np versions
+_log, _sqrt, _exp, _erfc = math.log, math.sqrt, math.exp, math.erfc
+_SQRT_2 = 1.4142135623730951
+
+def _norm_cdf(x: float) -> float:
+    """Scalar standard normal CDF via math.erfc; a single libm call,
+    cheaper than ndtr for one float"""
+    return 0.5 * _erfc(-x / _SQRT_2)
+
+def _prob_between(z_lo, z_hi):
+    """P(z_lo < Z < z_hi) for standard normal Z; scalars or arrays.
+
+    Goes straight to ndtr so a whole batch of z-scores costs one pair of
+    C calls instead of per-element dispatch.
+    """
+    return ndtr(z_hi) - ndtr(z_lo)
+
+# Precomputed per-expiry terms shared across pricing, Greeks, and probability
+# helpers so log/sqrt/exp are not recomputed for every leg
+BSCtx = namedtuple('BSCtx', 'sqrt_T vol drift disc')
+
+def _make_bs_ctx(T: float, r: float, sigma: float) -> BSCtx:
+    """Build the shared context for one (T, r, sigma) combination"""
+    sqrt_T = _sqrt(T)
+    return BSCtx(sqrt_T, sigma * sqrt_T, (r + 0.5 * sigma**2) * T, _exp(-r * T))
+
 def black_scholes_call(S: float, K: float, T: float, r: float, sigma: float) -> float:
     """Calculate Black-Scholes call option price"""
+    if NUMBA_AVAILABLE:
+        return bs_price(S, K, T, r, sigma, True)
     if T <= 0:
         return max(0, S - K)
-    
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    
-    call_price = S * stats.norm.cdf(d1) - K * np.exp(-r * T) * stats.norm.cdf(d2)
+
+    vol = sigma * _sqrt(T)
+    d1 = (_log(S / K) + (r + 0.5 * sigma**2) * T) / vol
+    d2 = d1 - vol
+
+    call_price = S * ndtr(d1) - K * _exp(-r * T) * ndtr(d2)
     return call_price
 
 def black_scholes_put(S: float, K: float, T: float, r: float, sigma: float) -> float:
     """Calculate Black-Scholes put option price"""
+    if NUMBA_AVAILABLE:
+        return bs_price(S, K, T, r, sigma, False)
     if T <= 0:
         return max(0, K - S)
-    
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    
-    put_price = K * np.exp(-r * T) * stats.norm.cdf(-d2) - S * stats.norm.cdf(-d1)
+
+    vol = sigma * _sqrt(T)
+    d1 = (_log(S / K) + (r + 0.5 * sigma**2) * T) / vol
+    d2 = d1 - vol
+
+    put_price = K * _exp(-r * T) * ndtr(-d2) - S * ndtr(-d1)
     return put_price
 
-def calculate_greeks(S: float, K: float, T: float, r: float, sigma: float, 
-                     option_type: str) -> Dict[str, float]:
-    """Calculate option Greeks"""
+def _bs_vec(S: float, K_arr: np.ndarray, T: float, r: float, sigma: float,
+            is_call_arr: np.ndarray, ctx: Optional[BSCtx] = None) -> np.ndarray:
+    """Price a vector of options sharing spot/expiry/vol in one pass.
+
+    Computing sqrt(T), the drift term, and the discount factor once and
+    pricing all strikes through a single ndtr call is much cheaper than
+    calling the scalar helpers once per leg. Pass a BSCtx to share those
+    terms with other helpers working on the same expiry.
+    """
     if T <= 0:
-        return {"delta": 0, "gamma": 0, "theta": 0, "vega": 0}
-    
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    
-    if option_type.upper() == 'C':
-        delta = stats.norm.cdf(d1)
-        theta = (-S * stats.norm.pdf(d1) * sigma / (2 * np.sqrt(T)) - 
-                 r * K * np.exp(-r * T) * stats.norm.cdf(d2)) / 365
-    else:  # Put
-        delta = stats.norm.cdf(d1) - 1
-        theta = (-S * stats.norm.pdf(d1) * sigma / (2 * np.sqrt(T)) + 
-                 r * K * np.exp(-r * T) * stats.norm.cdf(-d2)) / 365
-    
-    gamma = stats.norm.pdf(d1) / (S * sigma * np.sqrt(T))
-    vega = S * stats.norm.pdf(d1) * np.sqrt(T) / 100
-    
-    return {
+        intrinsic_call = np.maximum(0.0, S - K_arr)
+        intrinsic_put = np.maximum(0.0, K_arr - S)
+        return np.where(is_call_arr, intrinsic_call, intrinsic_put)
+
+    if ctx is None:
+        ctx = _make_bs_ctx(T, r, sigma)
+    d1 = (np.log(S / K_arr) + ctx.drift) / ctx.vol
+    d2 = d1 - ctx.vol
+
+    call_prices = S * ndtr(d1) - K_arr * ctx.disc * ndtr(d2)
+    put_prices = K_arr * ctx.disc * ndtr(-d2) - S * ndtr(-d1)
+    return np.where(is_call_arr, call_prices, put_prices)
+
+def calculate_greeks(S: float, K: float, T: float, r: float, sigma: float,
+                     option_type: str,
+                     which: Optional[Tuple[str, ...]] = None) -> Dict[str, float]:
+    """Calculate option Greeks.
+
+    `which` limits the result to the named Greeks; theta (the only one
+    needing extra CDF work) is skipped entirely when not requested.
+    """
+    if NUMBA_AVAILABLE:
+        delta, gamma, theta, vega = bs_greeks(S, K, T, r, sigma,
+                                              option_type.upper() == 'C')
+        out = {"delta": delta, "gamma": gamma, "theta": theta, "vega": vega}
+        if which is not None:
+            return {g: out[g] for g in which}
+        return out
+    if T <= 0:
+        out = {"delta": 0, "gamma": 0, "theta": 0, "vega": 0}
+        if which is not None:
+            return {g: out[g] for g in which}
+        return out
+
+    sqrt_T = _sqrt(T)
+    vol = sigma * sqrt_T
+    d1 = (_log(S / K) + (r + 0.5 * sigma**2) * T) / vol
+    d2 = d1 - vol
+    disc = _exp(-r * T)
+    pdf_d1 = _exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+
+    is_call = option_type.upper() == 'C'
+    need_theta = which is None or 'theta' in which
+
+    delta = ndtr(d1) if is_call else ndtr(d1) - 1
+    if need_theta:
+        if is_call:
+            theta = (-S * pdf_d1 * sigma / (2 * sqrt_T) -
+                     r * K * disc * ndtr(d2)) / 365
+        else:
+            theta = (-S * pdf_d1 * sigma / (2 * sqrt_T) +
+                     r * K * disc * ndtr(-d2)) / 365
+    else:
+        theta = 0.0
+
+    gamma = pdf_d1 / (S * vol)
+    vega = S * pdf_d1 * sqrt_T / 100
+
+    out = {
         "delta": delta,
         "gamma": gamma,
         "theta": theta,
         "vega": vega
     }
+    if which is not None:
+        return {g: out[g] for g in which}
+    return out
 
 # ==================== Iron Condor Analysis Functions ====================
 
@@ -234,97 +577,135 @@ def calculate_iron_condor_payoff(underlying_price: float, strikes: Dict[str, flo
     sc = strikes['short_call']
     sp = strikes['short_put']
     lp = strikes['long_put']
-    
-    # Call spread P&L
-    if underlying_price <= sc:
-        call_pnl = 0
-    elif underlying_price >= lc:
-        call_pnl = -(lc - sc)
-    else:
-        call_pnl = -(underlying_price - sc)
-    
-    # Put spread P&L
-    if underlying_price >= sp:
-        put_pnl = 0
-    elif underlying_price <= lp:
-        put_pnl = -(sp - lp)
-    else:
-        put_pnl = -(sp - underlying_price)
-    
+
+    if NUMBA_AVAILABLE:
+        return ic_payoff_scalar(underlying_price, lp, sp, sc, lc, net_credit)
+
+    # Branchless clamp of each spread's loss to [0, width]; same piecewise
+    # values as the if/elif chains without unpredictable branches
+    call_pnl = -max(0.0, min(underlying_price - sc, lc - sc))
+    put_pnl = -max(0.0, min(sp - underlying_price, sp - lp))
+
     total_pnl = (call_pnl + put_pnl) * 100 + net_credit
     return total_pnl
 
-def calculate_probability_itm(S: float, K: float, T: float, sigma: float, 
-                              option_type: str) -> float:
+def ic_payoff_grid(prices: np.ndarray, lp: float, sp: float, sc: float,
+                   lc: float, credit: float) -> np.ndarray:
+    """Iron condor P&L over a price grid, accumulating in one buffer.
+
+    The four clipped legs are folded into a single output array with
+    out= ufunc calls, so a large grid makes one pass per leg instead of
+    allocating a fresh temporary for every intermediate.
+    """
+    pnl = np.clip(prices - sc, 0.0, None)
+    np.subtract(pnl, np.clip(prices - lc, 0.0, None), out=pnl)
+    np.add(pnl, np.clip(sp - prices, 0.0, None), out=pnl)
+    np.subtract(pnl, np.clip(lp - prices, 0.0, None), out=pnl)
+    pnl *= -100.0
+    pnl += credit
+    return pnl
+
+@lru_cache(maxsize=1024)
+def _mk_payoff(lp: float, sp: float, sc: float, lc: float, credit: float):
+    """Payoff function specialized to one strike set
+
+    Monitoring re-evaluates the same strikes at many prices, so the strike
+    constants (and spread widths) are bound once per strike set and only
+    the price varies per call. Cached on the strike tuple so repeated
+    monitor requests for a strategy reuse the same closure.
+    """
+    if NUMBA_AVAILABLE:
+        def payoff(price: float) -> float:
+            return ic_payoff_scalar(price, lp, sp, sc, lc, credit)
+        return payoff
+
+    call_width = lc - sc
+    put_width = sp - lp
+
+    def payoff(price: float) -> float:
+        return (-max(0.0, min(price - sc, call_width))
+                - max(0.0, min(sp - price, put_width))) * 100.0 + credit
+    return payoff
+
+def calculate_probability_itm(S: float, K: float, T: float, sigma: float,
+                              option_type: str, ctx: Optional[BSCtx] = None) -> float:
     """Calculate probability of option being ITM at expiration"""
     if T <= 0:
         return 1.0 if (option_type == 'C' and S > K) or (option_type == 'P' and S < K) else 0.0
-    
-    d2 = (np.log(S / K) + (-0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+
+    vol = ctx.vol if ctx is not None else sigma * _sqrt(T)
+    d2 = (_log(S / K) + (-0.5 * sigma**2) * T) / vol
     
     if option_type.upper() == 'C':
-        return 1 - stats.norm.cdf(d2)
+        return 1 - ndtr(d2)
     else:
-        return stats.norm.cdf(d2)
+        return ndtr(d2)
+
+@lru_cache(maxsize=256)
+def _pop_z_score(target_pop_milli: int) -> float:
+    """z-score for a probability-of-profit target, cached on 1e-3 buckets
+
+    target_pop is constrained to [0.5, 0.95] and is almost always the 0.70
+    default, so the expensive ppf call hits the cache in practice.
+    """
+    return float(ndtri((1 + target_pop_milli / 1000.0) / 2))
 
 def optimize_iron_condor_strikes(current_price: float, T: float, sigma: float,
                                  target_pop: float, wing_width: float) -> Dict[str, float]:
     """Optimize iron condor strikes for target probability of profit"""
-    
+
     # Calculate standard deviation of price movement
-    price_std = current_price * sigma * np.sqrt(T)
-    
+    price_std = current_price * sigma * _sqrt(T)
+
     # For target PoP, find the z-score
     # PoP relates to probability that price stays between short strikes
-    z_score = stats.norm.ppf((1 + target_pop) / 2)
-    
-    # Place short strikes at z-score standard deviations
-    short_call_strike = current_price + (z_score * price_std)
-    short_put_strike = current_price - (z_score * price_std)
-    
-    # Add wings
-    long_call_strike = short_call_strike + wing_width
-    long_put_strike = short_put_strike - wing_width
+    z_score = _pop_z_score(int(round(target_pop * 1000)))
     
-    # Round to nearest 5
+    # Place short strikes at z-score standard deviations, add wings, and
+    # round all four strikes to the nearest 5 in one vectorized pass
+    band = z_score * price_std
+    raw = np.array([current_price + band + wing_width,
+                    current_price + band,
+                    current_price - band,
+                    current_price - band - wing_width])
+    long_call, short_call, short_put, long_put = (np.rint(raw / 5.0) * 5.0).tolist()
+
     return {
-        'long_call': round(long_call_strike / 5) * 5,
-        'short_call': round(short_call_strike / 5) * 5,
-        'short_put': round(short_put_strike / 5) * 5,
-        'long_put': round(long_put_strike / 5) * 5
+        'long_call': long_call,
+        'short_call': short_call,
+        'short_put': short_put,
+        'long_put': long_put
     }
 
-def calculate_strategy_score(return_on_risk: float, probability_of_profit: float, 
+# Time-preference score by days to expiration, precomputed once so chain
+# scans index instead of branching: 100 in the preferred 30-45 day window,
+# ramping up below 30 and decaying 2 points/day past 45 (0 from day 95 on)
+_TIME_SCORE = np.where(
+    (np.arange(181) >= 30) & (np.arange(181) <= 45), 100.0,
+    np.where(np.arange(181) < 30, np.arange(181) / 30 * 100,
+             np.maximum(0.0, 100.0 - (np.arange(181) - 45) * 2)))
+
+_RATING_EDGES = np.array([50.0, 65.0, 80.0])
+_RATINGS = ("Poor", "Fair", "Good", "Excellent")
+
+def calculate_strategy_score(return_on_risk: float, probability_of_profit: float,
                             days_to_expiration: int) -> float:
     """Calculate overall strategy quality score (0-100)"""
     # Weight factors
     ror_score = min(100, return_on_risk * 2)  # 50% ROR = 100 score
     pop_score = probability_of_profit  # Already 0-100
-    
-    # Time factor (prefer 30-45 days to expiration)
-    if 30 <= days_to_expiration <= 45:
-        time_score = 100
-    elif days_to_expiration < 30:
-        time_score = max(0, (days_to_expiration / 30) * 100)
-    else:
-        time_score = max(0, 100 - ((days_to_expiration - 45) * 2))
-    
+
+    # Time factor via the precomputed table (prefer 30-45 days)
+    time_score = _TIME_SCORE[min(max(days_to_expiration, 0), 180)]
+
     # Weighted average
     total_score = (ror_score * 0.3) + (pop_score * 0.5) + (time_score * 0.2)
-    return round(total_score, 2)
+    return round(float(total_score), 2)
 
 def get_strategy_rating(return_on_risk: float, probability_of_profit: float) -> str:
     """Get qualitative rating for strategy"""
     score = (return_on_risk * 2 * 0.4) + (probability_of_profit * 0.6)
-    
-    if score >= 80:
-        return "Excellent"
-    elif score >= 65:
-        return "Good"
-    elif score >= 50:
-        return "Fair"
-    else:
-        return "Poor"
+    return _RATINGS[np.searchsorted(_RATING_EDGES, score, side='right')]
 
 # ==================== API Endpoints ====================
 
@@ -342,7 +723,7 @@ async def root():
             "Position Management",
             "Real-time Updates"
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 @app.get("/health")
@@ -351,132 +732,648 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "fastapi-market-data",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "uptime": time.process_time()
     }
 
+def _compute_symbol_data(symbol: str, ts: str, noise: Optional[np.ndarray],
+                         price_data: Optional[Dict[str, Any]] = None,
+                         indicators: Optional[Dict[str, Any]] = None,
+                         sentiment: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, Any]]:
+    """Full market-data payload for one symbol; safe to run on a worker thread.
+
+    The per-symbol streaming state lives under distinct dict keys, so
+    threads working on different symbols never touch the same entry;
+    concurrent requests for the same unseeded symbol are safe because
+    _seed_indicator_state writes the _RSI_STATE guard key last.
+    Callers that already built prices or indicators in bulk pass them in.
+    """
+    if price_data is None:
+        price_data = generate_market_price(symbol, ts, noise)
+
+    if indicators is None and symbol in _RSI_STATE:
+        # Symbol already seeded: one-step streaming update
+        indicators = _update_streaming_indicators(symbol, price_data["last"])
+    elif indicators is None:
+        # First sight of this symbol: draw a history (kept as an ndarray
+        # end to end; no list round-trip), compute the indicators once,
+        # and seed the streaming state
+        historical_prices = (price_data["last"] *
+                             (1 + _rng.standard_normal(50) * _HIST_NOISE_STD))
+        indicators = calculate_technical_indicators(historical_prices)
+        _seed_indicator_state(symbol, historical_prices)
+
+    if sentiment is None:
+        # Single change_percent lookup; index 0/1/2 selects the signal
+        # without branching
+        cp = price_data["change_percent"]
+        sentiment = {
+            "score": round(50 + cp * 5, 1),
+            "signal": _SENTIMENT_SIGNALS[int(cp > -0.5) + int(cp > 0.5)]
+        }
+    return symbol, {
+        "price": price_data,
+        "indicators": indicators,
+        "sentiment": sentiment,
+        "processed_at": ts
+    }
+
 @app.post("/market-data")
-async def get_market_data(request: MarketDataRequest):
+async def get_market_data(http_request: Request):
     """
     Fetch and process market data for given symbols
-    
+
     Args:
-        request: MarketDataRequest containing symbols and optional timeframe
-        
+        http_request: body decodes to MarketDataRequest (symbols and
+            optional timeframe)
+
     Returns:
         Processed market data with prices, indicators, and analysis
     """
+    request = await _decode_body(http_request, _MARKET_DATA_DECODER)
     try:
         if not request.symbols:
             raise HTTPException(status_code=400, detail="At least one symbol is required")
-        
-        market_data = {}
-        
-        for symbol in request.symbols:
-            price_data = generate_market_price(symbol)
-            
-            # Generate historical prices for indicators
-            historical_prices = [
-                price_data["last"] * (1 + (random.random() - 0.5) * 0.01)
-                for _ in range(50)
-            ]
-            
-            indicators = calculate_technical_indicators(historical_prices)
-            
-            market_data[symbol] = {
-                "price": price_data,
-                "indicators": indicators,
-                "sentiment": {
-                    "score": round(50 + (price_data["change_percent"] * 5), 1),
-                    "signal": "bullish" if price_data["change_percent"] > 0.5 else "bearish" if price_data["change_percent"] < -0.5 else "neutral"
-                },
-                "processed_at": datetime.now().isoformat()
-            }
-        
+
+        # One timestamp per request instead of three isoformat calls per symbol
+        ts = _now_iso()
+
+        # One vectorized draw for all per-symbol price noise, and one
+        # vectorized pass for all price snapshots
+        price_noise = _rng.random((len(request.symbols), 3))
+        price_map = generate_market_prices(request.symbols, ts, price_noise)
+
+        # Symbols seen for the first time get their indicator seed from
+        # one parallel 2-D kernel call instead of a per-symbol pass
+        prebuilt: Dict[str, Dict[str, Any]] = {}
+        fresh = [s for s in request.symbols if s not in _RSI_STATE]
+        if NUMBA_AVAILABLE and len(fresh) > 8:
+            lasts = np.array([price_map[s]["last"] for s in fresh])
+            hist = lasts[:, None] * (
+                1 + _rng.standard_normal((len(fresh), 50)) * _HIST_NOISE_STD)
+            values = indicators_batch(hist)
+            # Display precision applied once over the whole block instead
+            # of seven round() calls per symbol (rsi column rounds to 2)
+            np.round(values, 4, out=values)
+            np.round(values[:, 0], 2, out=values[:, 0])
+            for j, symbol in enumerate(fresh):
+                rsi, macd, signal, sma_20, sma_50, ema_12, ema_26 = values[j].tolist()
+                prebuilt[symbol] = {
+                    "rsi": rsi, "macd": macd, "macd_signal": signal,
+                    "sma_20": sma_20, "sma_50": sma_50,
+                    "ema_12": ema_12, "ema_26": ema_26,
+                }
+                _seed_indicator_state(symbol, hist[j])
+
+        # Sentiment for every symbol in one vectorized pass: scores and
+        # signal indices come from whole-array ops instead of N ternaries
+        # and N round() calls
+        n = len(request.symbols)
+        cps = np.fromiter((price_map[s]["change_percent"] for s in request.symbols),
+                          dtype=np.float64, count=n)
+        scores = 50 + cps * 5
+        signal_idx = (cps > -0.5).astype(np.int8) + (cps > 0.5)
+        # round() rather than np.round keeps scores bit-identical with the
+        # scalar fallback path on .x5 halves
+        sentiments = [
+            {"score": round(score, 1), "signal": _SENTIMENT_SIGNALS[i]}
+            for score, i in zip(scores.tolist(), signal_idx.tolist())
+        ]
+
+        if n > 8:
+            # Per-symbol work is independent and mostly GIL-releasing
+            # NumPy code, so wide requests spread across the default
+            # thread pool instead of serializing on the event loop
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(*[
+                loop.run_in_executor(None, _compute_symbol_data, symbol, ts,
+                                     None, price_map[symbol], prebuilt.get(symbol),
+                                     sentiment)
+                for symbol, sentiment in zip(request.symbols, sentiments)
+            ])
+            market_data = dict(results)
+        else:
+            market_data = dict(
+                _compute_symbol_data(symbol, ts, None, price_map[symbol],
+                                     prebuilt.get(symbol), sentiment)
+                for symbol, sentiment in zip(request.symbols, sentiments))
+
         return {
             "success": True,
             "data": market_data,
             "symbols_count": len(request.symbols),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
         
     except Exception as e:
         logger.error(f"Error processing market data: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to process market data: {str(e)}")
 
+# Polling UIs re-request the same symbol set every 100-250 ms; within
+# this window they share one serialized /analyze payload.
+_ANALYZE_CACHE_TTL = 0.5
+
+@app.post("/analyze")
+async def analyze_market(http_request: Request):
+    """
+    Cross-symbol market analysis: correlations and trend summaries
+
+    The correlation matrix is generated with a single (N, N) draw,
+    symmetrized, and converted to nested dicts once; trend fields come
+    from one vectorized change_percent batch instead of per-pair Python
+    loops. Responses are cached for 500 ms per sorted symbol set.
+
+    Returns:
+        Correlation matrix and per-symbol trend analysis
+    """
+    request = await _decode_body(http_request, _MARKET_DATA_DECODER)
+    try:
+        symbols = request.symbols
+        if not symbols:
+            raise HTTPException(status_code=400, detail="At least one symbol is required")
+
+        n = len(symbols)
+
+        def build():
+            # One C-level fill for all N^2 pairwise correlations, rounded
+            # in place to skip the extra N^2 copy
+            m = _rng.random((n, n)) * 0.8 + 0.1
+            m += m.T
+            m *= 0.5
+            np.fill_diagonal(m, 1.0)
+            np.round(m, 3, out=m)
+            # Columnar form instead of nested dicts: no N^2 dict/key
+            # overhead, ~half the JSON bytes, and the float32 ndarray
+            # serializes in one orjson pass. Row/column order follows
+            # "symbols"; clients index matrix[i][j].
+            correlation_matrix = {
+                "symbols": symbols,
+                "matrix": m.astype(np.float32),
+            }
+
+            # Batch-generate trend inputs as vectors
+            change_percents = ((_rng.random(n) - 0.5) * 4).round(2)
+            strengths = np.minimum(np.abs(change_percents) * 10, 100.0).round(1)
+            trends = {
+                symbol: {
+                    "change_percent": cp,
+                    "direction": ("down", "sideways", "up")[int(cp > -0.5) + int(cp > 0.5)],
+                    "strength": strength
+                }
+                for symbol, cp, strength in zip(symbols, change_percents.tolist(),
+                                                strengths.tolist())
+            }
+
+            return {
+                "success": True,
+                "correlation_matrix": correlation_matrix,
+                "trends": trends,
+                "symbols_count": n,
+                "timestamp": _now_iso()
+            }
+
+        key = "analyze:" + ",".join(sorted(symbols))
+        return _cached_json_response(key, build,
+                                     http_request.headers.get("if-none-match"),
+                                     ttl=_ANALYZE_CACHE_TTL)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Market analysis failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Market analysis failed: {str(e)}")
+
+# Short-TTL response cache for the sample positions/equity endpoints:
+# within one tick every request for an account shares a single serialized
+# payload, and clients that present the matching ETag get a bodyless 304.
+# Kept in-module (dict + blake2b) rather than pulling in a cache dependency.
+_RESP_CACHE: Dict[str, Tuple[float, bytes, str]] = {}
+_RESP_CACHE_TTL = 1.0
+
+# Sample positions kept struct-of-arrays at module scope: arithmetic
+# (per-position P&L and its total) runs as C-level vector ops over the
+# columns, and rows only become dicts at the serialization boundary.
+# Scales to real broker data with hundreds of positions without paying
+# per-dict round()/sum() costs; only position_id and open_time vary per
+# request.
+_POS_SYMBOLS: Tuple[str, ...] = ("EURUSD",)
+_POS_TYPES: Tuple[str, ...] = ("LONG",)
+_POS_QUANTITY = np.array([100000.0])
+_POS_ENTRY = np.array([1.0850])
+_POS_CURRENT = np.array([1.0875])
+_POS_COMMISSION = np.array([5.0])
+_POS_SIGN = np.where(np.array(_POS_TYPES) == "LONG", 1.0, -1.0)
+_POS_PNL = np.round((_POS_CURRENT - _POS_ENTRY) * _POS_QUANTITY * _POS_SIGN, 2)
+_POS_TOTAL_PNL = round(float(_POS_PNL.sum()), 2)
+
+def _cached_json_response(key: str, build, if_none_match: Optional[str],
+                          ttl: float = _RESP_CACHE_TTL) -> Response:
+    """Serve `build()`'s payload from a per-key TTL cache with ETag/304"""
+    now = time.time()
+    hit = _RESP_CACHE.get(key)
+    if hit is None or now - hit[0] >= ttl:
+        if len(_RESP_CACHE) > 1024:
+            # Keyed by request shape (e.g. symbol sets), so bound growth by
+            # dropping anything already past the default TTL
+            for k in [k for k, v in _RESP_CACHE.items()
+                      if now - v[0] >= _RESP_CACHE_TTL]:
+                del _RESP_CACHE[k]
+        body = orjson.dumps(build(), option=orjson.OPT_SERIALIZE_NUMPY)
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        hit = (now, body, etag)
+        _RESP_CACHE[key] = hit
+    _, body, etag = hit
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json",
+                    headers={"ETag": etag})
+
 @app.get("/positions")
-async def get_positions(account_id: Optional[str] = Query(None, description="Account ID")):
+async def get_positions(request: Request,
+                        account_id: Optional[str] = Query(None, description="Account ID")):
     """
     Retrieve current trading positions
     """
     try:
-        positions = [
-            {
-                "position_id": f"POS_{random.randint(1000, 9999)}",
-                "symbol": "EURUSD",
-                "position_type": "LONG",
-                "quantity": 100000.0,
-                "entry_price": 1.0850,
-                "current_price": 1.0875,
-                "unrealized_pnl": 250.0,
-                "commission": 5.0,
-                "open_time": datetime.now().isoformat()
+        def build():
+            ts = _now_iso()
+            pids = _rng.integers(1000, 10000, size=len(_POS_SYMBOLS))
+            positions = [
+                {
+                    "position_id": f"POS_{pid}",
+                    "symbol": symbol,
+                    "position_type": ptype,
+                    "quantity": qty,
+                    "entry_price": entry,
+                    "current_price": current,
+                    "unrealized_pnl": pnl,
+                    "commission": commission,
+                    "open_time": ts
+                }
+                for pid, symbol, ptype, qty, entry, current, pnl, commission
+                in zip(pids, _POS_SYMBOLS, _POS_TYPES,
+                       _POS_QUANTITY.tolist(), _POS_ENTRY.tolist(),
+                       _POS_CURRENT.tolist(), _POS_PNL.tolist(),
+                       _POS_COMMISSION.tolist())
+            ]
+            return {
+                "success": True,
+                "account_id": account_id or "DEFAULT",
+                "positions": positions,
+                "total_positions": len(positions),
+                "total_unrealized_pnl": _POS_TOTAL_PNL,
+                "timestamp": ts
             }
-        ]
-        
-        total_pnl = sum(pos["unrealized_pnl"] for pos in positions)
-        
-        return {
-            "success": True,
-            "account_id": account_id or "DEFAULT",
-            "positions": positions,
-            "total_positions": len(positions),
-            "total_unrealized_pnl": round(total_pnl, 2),
-            "timestamp": datetime.now().isoformat()
-        }
-        
+
+        return _cached_json_response(f"positions:{account_id}", build,
+                                     request.headers.get("if-none-match"))
     except Exception as e:
         logger.error(f"Error fetching positions: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch positions: {str(e)}")
 
 @app.get("/equity")
-async def get_equity(account_id: Optional[str] = Query(None, description="Account ID")):
+async def get_equity(request: Request,
+                     account_id: Optional[str] = Query(None, description="Account ID")):
     """
     Retrieve account equity and balance information
     """
     try:
-        base_equity = 50000.0
-        unrealized_pnl = random.random() * 1000 - 500
-        
-        equity_data = {
-            "broker": "FastAPI",
-            "account_id": account_id or "DEFAULT",
-            "equity_balance": round(base_equity + unrealized_pnl, 2),
-            "cash_balance": base_equity,
-            "margin_used": round(base_equity * 0.04, 2),
-            "available_margin": round(base_equity * 0.96, 2),
-            "unrealized_pnl": round(unrealized_pnl, 2),
-            "margin_level": round((base_equity + unrealized_pnl) / (base_equity * 0.04) * 100, 2),
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        return {
-            "success": True,
-            "data": equity_data,
-            "timestamp": datetime.now().isoformat()
-        }
-        
+        def build():
+            ts = _now_iso()
+            base_equity = 50000.0
+            unrealized_pnl = _rng.random() * 1000 - 500
+            equity, margin_used, available, pnl, margin_level = np.round(
+                [base_equity + unrealized_pnl, base_equity * 0.04,
+                 base_equity * 0.96, unrealized_pnl,
+                 (base_equity + unrealized_pnl) / (base_equity * 0.04) * 100],
+                2).tolist()
+            equity_data = {
+                "broker": "FastAPI",
+                "account_id": account_id or "DEFAULT",
+                "equity_balance": equity,
+                "cash_balance": base_equity,
+                "margin_used": margin_used,
+                "available_margin": available,
+                "unrealized_pnl": pnl,
+                "margin_level": margin_level,
+                "timestamp": ts
+            }
+            return {
+                "success": True,
+                "data": equity_data,
+                "timestamp": ts
+            }
+
+        return _cached_json_response(f"equity:{account_id}", build,
+                                     request.headers.get("if-none-match"))
     except Exception as e:
         logger.error(f"Error fetching equity: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch equity: {str(e)}")
 
 # ==================== Iron Condor Strategy Endpoints ====================
 
+def _analyze_iron_condor_core(symbol: str, expiration_date: str,
+                              long_call_strike: float, short_call_strike: float,
+                              short_put_strike: float, long_put_strike: float,
+                              contracts: int = 1,
+                              current_price: Optional[float] = None,
+                              implied_volatility: float = 0.20,
+                              risk_free_rate: float = 0.05) -> Dict[str, Any]:
+    """
+    Shared iron condor analysis used by the analyze and optimize endpoints
+
+    Works on plain primitives so internal callers skip pydantic model
+    construction; request validation happens only at the HTTP boundary.
+    Raises ValueError for expirations that are not in the future.
+    """
+    # Parse expiration date
+    expiration = datetime.strptime(expiration_date, "%Y-%m-%d")
+    days_to_expiration = (expiration - datetime.now()).days
+    years_to_expiration = days_to_expiration / 365.0
+
+    if days_to_expiration <= 0:
+        raise ValueError("Expiration date must be in the future")
+
+    # Use provided current price or calculate midpoint
+    current_price = current_price or (short_call_strike + short_put_strike) / 2
+
+    # Calculate spread widths
+    call_spread_width = long_call_strike - short_call_strike
+    put_spread_width = short_put_strike - long_put_strike
+
+    # Calculate option prices using Black-Scholes
+    r = risk_free_rate
+    sigma = implied_volatility
+    T = years_to_expiration
+
+    # Shared per-expiry terms reused for pricing, probabilities, and the
+    # price-std below
+    ctx = _make_bs_ctx(T, r, sigma)
+
+    leg_strikes = np.array([long_call_strike, short_call_strike,
+                            short_put_strike, long_put_strike])
+    leg_is_call = np.array([True, True, False, False])
+    long_call_price, short_call_price, short_put_price, long_put_price = _bs_vec(
+        current_price, leg_strikes, T, r, sigma, leg_is_call, ctx=ctx)
+
+    # Calculate net credit
+    call_spread_credit = short_call_price - long_call_price
+    put_spread_credit = short_put_price - long_put_price
+    net_credit = (call_spread_credit + put_spread_credit) * contracts * 100
+
+    # Calculate max profit and loss
+    max_profit = net_credit
+    max_loss = (max(call_spread_width, put_spread_width) * contracts * 100) - net_credit
+
+    # Calculate breakeven points
+    credit_per_share = net_credit / (contracts * 100)
+    upper_breakeven = short_call_strike + credit_per_share
+    lower_breakeven = short_put_strike - credit_per_share
+
+    # Calculate return on risk
+    return_on_risk = (max_profit / max_loss * 100) if max_loss > 0 else 0
+
+    # Calculate probability of profit
+    price_std = current_price * ctx.vol
+    z_upper = (upper_breakeven - current_price) / price_std
+    z_lower = (lower_breakeven - current_price) / price_std
+
+    prob_below_upper = _norm_cdf(z_upper) * 100
+    prob_below_lower = _norm_cdf(z_lower) * 100
+    probability_of_profit = prob_below_upper - prob_below_lower
+
+    # Calculate individual leg probabilities
+    prob_short_call_itm = calculate_probability_itm(current_price, short_call_strike, T, sigma, 'C', ctx=ctx) * 100
+    prob_short_put_itm = calculate_probability_itm(current_price, short_put_strike, T, sigma, 'P', ctx=ctx) * 100
+
+    # Optimal strike recommendations
+    optimal_strikes = optimize_iron_condor_strikes(current_price, T, sigma, 0.70,
+                                                   max(call_spread_width, put_spread_width))
+
+    # Sensitivity analysis
+    upside_room = ((upper_breakeven - current_price) / current_price) * 100
+    downside_room = ((current_price - lower_breakeven) / current_price) * 100
+
+    # Calculate payoff at various price points
+    price_points = np.linspace(current_price * 0.85, current_price * 1.15, 20)
+    pnl_points = ic_payoff_grid(price_points, long_put_strike, short_put_strike,
+                                short_call_strike, long_call_strike, net_credit)
+    payoff_profile = [
+        {"price": price, "pnl": pnl}
+        for price, pnl in zip(np.round(price_points, 2).tolist(),
+                              np.round(pnl_points, 2).tolist())
+    ]
+
+    # Quality metrics
+    score = calculate_strategy_score(return_on_risk, probability_of_profit, days_to_expiration)
+    rating = get_strategy_rating(return_on_risk, probability_of_profit)
+
+    # One fused rounding pass over the scalar response fields instead of
+    # ~15 Python-level round() dispatches
+    (r_max_profit, r_max_loss, r_ror, r_net_credit, r_upper_be, r_lower_be,
+     r_be_range, r_be_range_pct, r_pop, r_pol, r_prob_sc, r_prob_sp,
+     r_upside, r_downside) = np.round(
+        [max_profit, max_loss, return_on_risk, net_credit,
+         upper_breakeven, lower_breakeven,
+         upper_breakeven - lower_breakeven,
+         (upper_breakeven - lower_breakeven) / current_price * 100,
+         probability_of_profit, 100 - probability_of_profit,
+         prob_short_call_itm, prob_short_put_itm,
+         upside_room, downside_room], 2).tolist()
+
+    return {
+        "risk_reward": {
+            "max_profit": r_max_profit,
+            "max_loss": r_max_loss,
+            "return_on_risk_percent": r_ror,
+            "risk_reward_ratio": round(max_profit / max_loss, 3) if max_loss > 0 else 0,
+            "net_credit": r_net_credit
+        },
+        "breakevens": {
+            "upper": r_upper_be,
+            "lower": r_lower_be,
+            "range": r_be_range,
+            "range_percent": r_be_range_pct
+        },
+        "probability": {
+            "profit_percent": r_pop,
+            "loss_percent": r_pol,
+            "short_call_itm_percent": r_prob_sc,
+            "short_put_itm_percent": r_prob_sp,
+            "method": "black_scholes_normal_distribution"
+        },
+        "sensitivity": {
+            "upside_room_percent": r_upside,
+            "downside_room_percent": r_downside,
+            "days_to_expiration": days_to_expiration,
+            "implied_volatility": sigma,
+            "current_price": current_price
+        },
+        "recommendations": {
+            "optimal_long_call_strike": optimal_strikes['long_call'],
+            "optimal_short_call_strike": optimal_strikes['short_call'],
+            "optimal_short_put_strike": optimal_strikes['short_put'],
+            "optimal_long_put_strike": optimal_strikes['long_put'],
+            "reasoning": f"Strikes optimized for ~70% probability of profit based on {sigma:.0%} IV"
+        },
+        "quality_metrics": {
+            "score": score,
+            "rating": rating,
+            "factors": {
+                "return_on_risk": "Good" if return_on_risk > 20 else "Fair" if return_on_risk > 10 else "Poor",
+                "probability_of_profit": "Good" if probability_of_profit > 65 else "Fair" if probability_of_profit > 50 else "Poor",
+                "time_to_expiration": "Optimal" if 30 <= days_to_expiration <= 45 else "Acceptable" if days_to_expiration > 20 else "Risky"
+            }
+        },
+        "payoff_profile": payoff_profile
+    }
+
+@lru_cache(maxsize=4096)
+def _analyze_iron_condor_cached(symbol: str, expiration_date: str, as_of_date: str,
+                                long_call_strike: float, short_call_strike: float,
+                                short_put_strike: float, long_put_strike: float,
+                                contracts: int, current_price: Optional[float],
+                                implied_volatility: float,
+                                risk_free_rate: float) -> Dict[str, Any]:
+    """Memoized analysis over quantized inputs.
+
+    Dashboards poll the same strikes/IV repeatedly, so cache hits skip all
+    Black-Scholes and ndtr work. as_of_date keys the cache to the current
+    day because days_to_expiration changes at midnight. Callers must
+    quantize floats (strikes/price to 0.01, IV and rate to 1e-4) so near-
+    identical requests share an entry; the cached dict must not be mutated.
+    """
+    return _analyze_iron_condor_core(
+        symbol, expiration_date, long_call_strike, short_call_strike,
+        short_put_strike, long_put_strike, contracts=contracts,
+        current_price=current_price, implied_volatility=implied_volatility,
+        risk_free_rate=risk_free_rate)
+
+def _analyze_args(request: IronCondorAnalysisRequest) -> Tuple:
+    """Quantized positional args (= cache key) for one analyze request"""
+    return (
+        request.symbol,
+        request.expiration_date,
+        datetime.now().strftime("%Y-%m-%d"),
+        round(request.long_call_strike, 2),
+        round(request.short_call_strike, 2),
+        round(request.short_put_strike, 2),
+        round(request.long_put_strike, 2),
+        request.contracts,
+        round(request.current_price, 2) if request.current_price else None,
+        round(request.implied_volatility, 4),
+        round(request.risk_free_rate, 4)
+    )
+
+def _analyze_request(request: IronCondorAnalysisRequest) -> Dict[str, Any]:
+    """Run one analyze request through the memoized core with quantized keys"""
+    return _analyze_iron_condor_cached(*_analyze_args(request))
+
+def _analyze_batch_worker(args_list: List[Tuple]) -> List[Tuple[bool, Any]]:
+    """Pool-side analyze batch: runs in a worker process, results pickled back"""
+    out = []
+    for args in args_list:
+        try:
+            out.append((True, _analyze_iron_condor_cached(*args)))
+        except Exception as e:
+            out.append((False, e))
+    return out
+
+# Requests that arrive within one 5 ms tick are drained as a single batch,
+# so bursty dashboard traffic shares one event-loop wakeup (and one warm
+# cache walk) instead of paying scheduling overhead per request.
+_ANALYZE_TICK_SECONDS = 0.005
+_pending: List[Tuple[IronCondorAnalysisRequest, "asyncio.Future"]] = []
+_drain_task: Optional["asyncio.Task"] = None
+
+# Shared process pool for CPU-heavy fan-out. Created on startup so worker
+# processes fork with the warmed numba kernels and price tables already in
+# memory; small batches stay on the event loop because pickling would cost
+# more than the compute.
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_BATCH_THRESHOLD = 8
+_POOL_FANOUT_THRESHOLD = 100
+
+def _process_analyze_batch(batch: List[Tuple[IronCondorAnalysisRequest, "asyncio.Future"]]) -> None:
+    """Compute results for one drained batch and fan them back out"""
+    for req, fut in batch:
+        if fut.cancelled():
+            continue
+        try:
+            fut.set_result(_analyze_request(req))
+        except Exception as e:
+            fut.set_exception(e)
+
+async def _drain_analyze_queue() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(_ANALYZE_TICK_SECONDS)
+        if _pending:
+            batch = _pending[:]
+            _pending.clear()
+            if _POOL is not None and len(batch) > _POOL_BATCH_THRESHOLD:
+                # Large burst: compute off the event loop in one pool call.
+                # A broken or shut-down pool (worker OOM-killed, shutdown
+                # race) must not kill the drain task with the batch's
+                # futures unresolved — every waiting handler would hang —
+                # so on executor failure the batch falls back to the
+                # inline path, which is exception-safe per future.
+                try:
+                    args_list = [_analyze_args(req) for req, _ in batch]
+                    results = await loop.run_in_executor(
+                        _POOL, _analyze_batch_worker, args_list)
+                except Exception as e:
+                    logger.error(f"Analyze pool batch failed, falling back inline: {str(e)}")
+                    _process_analyze_batch(batch)
+                    continue
+                for (req, fut), (ok, val) in zip(batch, results):
+                    if fut.cancelled():
+                        continue
+                    if ok:
+                        fut.set_result(val)
+                    else:
+                        fut.set_exception(val)
+            else:
+                _process_analyze_batch(batch)
+
+async def _refresh_now_loop() -> None:
+    """Keep the _now_iso cache hot from one background tick.
+
+    One datetime.now() per 5 ms tick for the whole process; handler-side
+    _now_iso() calls then always take their cached fast path. _now_iso
+    still refreshes itself when the task is not running (process-pool
+    workers, bare TestClient use), so this is purely an amortization.
+    """
+    while True:
+        _NOW_CACHE[0] = time.monotonic_ns()
+        _NOW_CACHE[1] = datetime.now().isoformat()
+        await asyncio.sleep(_NOW_REFRESH_SECONDS)
+
+_NOW_REFRESH_SECONDS = 0.005
+_now_task: Optional["asyncio.Task"] = None
+
+@app.on_event("startup")
+async def _start_analyze_drain():
+    global _drain_task, _now_task, _POOL
+    _drain_task = asyncio.create_task(_drain_analyze_queue())
+    _now_task = asyncio.create_task(_refresh_now_loop())
+    _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+@app.on_event("shutdown")
+async def _stop_analyze_drain():
+    global _POOL
+    if _drain_task is not None:
+        _drain_task.cancel()
+    if _now_task is not None:
+        _now_task.cancel()
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
 @app.post("/iron-condor/analyze")
-async def analyze_iron_condor(request: IronCondorAnalysisRequest):
+async def analyze_iron_condor(request: Request):
     """
     Comprehensive iron condor strategy analysis
-    
+
     Returns:
         - Risk/reward metrics
         - Breakeven points
@@ -485,145 +1382,114 @@ async def analyze_iron_condor(request: IronCondorAnalysisRequest):
         - Sensitivity analysis
         - Quality metrics
     """
+    payload = await _decode_body(request, _ANALYZE_DECODER)
+    try:
+        if _drain_task is not None and not _drain_task.done():
+            # Join the current micro-batch tick
+            fut = asyncio.get_running_loop().create_future()
+            _pending.append((payload, fut))
+            analysis = await fut
+        else:
+            # Drain task not running (e.g. app used without its lifespan)
+            analysis = _analyze_request(payload)
+        return {
+            "success": True,
+            "analysis": analysis,
+            "timestamp": _now_iso()
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    except Exception as e:
+        logger.error(f"Iron condor analysis failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+
+
+@app.post("/iron-condor/analyze-batch")
+async def analyze_iron_condor_batch(request: IronCondorBatchAnalysisRequest):
+    """
+    Evaluate one iron condor across a grid of spot/IV scenarios
+
+    Prices the whole (current_prices x implied_volatilities) grid with a
+    single vectorized Black-Scholes pass, so the marginal cost of extra
+    scenarios is near zero compared with looping over /iron-condor/analyze.
+
+    Returns:
+        2-D arrays (rows = current_prices, cols = implied_volatilities) of
+        net credit, max profit/loss, breakevens, and probability of profit
+    """
     try:
-        # Parse expiration date
         expiration = datetime.strptime(request.expiration_date, "%Y-%m-%d")
         days_to_expiration = (expiration - datetime.now()).days
-        years_to_expiration = days_to_expiration / 365.0
-        
+        T = days_to_expiration / 365.0
+
         if days_to_expiration <= 0:
             raise HTTPException(status_code=400, detail="Expiration date must be in the future")
-        
-        # Use provided current price or calculate midpoint
-        current_price = request.current_price or (request.short_call_strike + request.short_put_strike) / 2
-        
-        # Calculate spread widths
+        if not request.current_prices or not request.implied_volatilities:
+            raise HTTPException(status_code=400,
+                                detail="current_prices and implied_volatilities must be non-empty")
+
+        r = request.risk_free_rate
+        contracts = request.contracts
+
+        # Broadcast to (n_prices, n_ivs, 4 legs)
+        S = np.asarray(request.current_prices, dtype=np.float64)[:, None, None]
+        sigma = np.asarray(request.implied_volatilities, dtype=np.float64)[None, :, None]
+        K = np.array([request.long_call_strike, request.short_call_strike,
+                      request.short_put_strike, request.long_put_strike])
+        is_call = np.array([True, True, False, False])
+
+        sqrt_T = np.sqrt(T)
+        vol = sigma * sqrt_T
+        disc = np.exp(-r * T)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / vol
+        d2 = d1 - vol
+
+        call_prices = S * ndtr(d1) - K * disc * ndtr(d2)
+        put_prices = K * disc * ndtr(-d2) - S * ndtr(-d1)
+        leg_prices = np.where(is_call, call_prices, put_prices)
+
+        # Per-scenario risk/reward
+        net_credit = (leg_prices[..., 1] - leg_prices[..., 0] +
+                      leg_prices[..., 2] - leg_prices[..., 3]) * contracts * 100
         call_spread_width = request.long_call_strike - request.short_call_strike
         put_spread_width = request.short_put_strike - request.long_put_strike
-        
-        # Calculate option prices using Black-Scholes
-        r = request.risk_free_rate
-        sigma = request.implied_volatility
-        T = years_to_expiration
-        
-        long_call_price = black_scholes_call(current_price, request.long_call_strike, T, r, sigma)
-        short_call_price = black_scholes_call(current_price, request.short_call_strike, T, r, sigma)
-        short_put_price = black_scholes_put(current_price, request.short_put_strike, T, r, sigma)
-        long_put_price = black_scholes_put(current_price, request.long_put_strike, T, r, sigma)
-        
-        # Calculate net credit
-        call_spread_credit = short_call_price - long_call_price
-        put_spread_credit = short_put_price - long_put_price
-        net_credit = (call_spread_credit + put_spread_credit) * request.contracts * 100
-        
-        # Calculate max profit and loss
-        max_profit = net_credit
-        max_loss = (max(call_spread_width, put_spread_width) * request.contracts * 100) - net_credit
-        
-        # Calculate breakeven points
-        credit_per_share = net_credit / (request.contracts * 100)
+        max_loss = max(call_spread_width, put_spread_width) * contracts * 100 - net_credit
+
+        credit_per_share = net_credit / (contracts * 100)
         upper_breakeven = request.short_call_strike + credit_per_share
         lower_breakeven = request.short_put_strike - credit_per_share
-        
-        # Calculate return on risk
-        return_on_risk = (max_profit / max_loss * 100) if max_loss > 0 else 0
-        
-        # Calculate probability of profit
-        price_std = current_price * sigma * np.sqrt(T)
-        z_upper = (upper_breakeven - current_price) / price_std
-        z_lower = (lower_breakeven - current_price) / price_std
-        
-        prob_below_upper = stats.norm.cdf(z_upper) * 100
-        prob_below_lower = stats.norm.cdf(z_lower) * 100
-        probability_of_profit = prob_below_upper - prob_below_lower
-        
-        # Calculate individual leg probabilities
-        prob_short_call_itm = calculate_probability_itm(current_price, request.short_call_strike, T, sigma, 'C') * 100
-        prob_short_put_itm = calculate_probability_itm(current_price, request.short_put_strike, T, sigma, 'P') * 100
-        
-        # Optimal strike recommendations
-        optimal_strikes = optimize_iron_condor_strikes(current_price, T, sigma, 0.70, 
-                                                      max(call_spread_width, put_spread_width))
-        
-        # Sensitivity analysis
-        upside_room = ((upper_breakeven - current_price) / current_price) * 100
-        downside_room = ((current_price - lower_breakeven) / current_price) * 100
-        
-        # Calculate payoff at various price points
-        price_points = np.linspace(current_price * 0.85, current_price * 1.15, 20)
-        strikes = {
-            'long_call': request.long_call_strike,
-            'short_call': request.short_call_strike,
-            'short_put': request.short_put_strike,
-            'long_put': request.long_put_strike
-        }
-        payoff_profile = [
-            {
-                "price": round(float(price), 2),
-                "pnl": round(calculate_iron_condor_payoff(price, strikes, net_credit), 2)
-            }
-            for price in price_points
-        ]
-        
-        # Quality metrics
-        score = calculate_strategy_score(return_on_risk, probability_of_profit, days_to_expiration)
-        rating = get_strategy_rating(return_on_risk, probability_of_profit)
-        
-        return {
+
+        # Probability of profit across the whole grid with one ndtr call pair
+        S2 = S[..., 0]
+        price_std = S2 * vol[..., 0]
+        probability_of_profit = _prob_between((lower_breakeven - S2) / price_std,
+                                              (upper_breakeven - S2) / price_std) * 100
+
+        # Return the response object directly: orjson serializes the numpy
+        # arrays natively (OPT_SERIALIZE_NUMPY), skipping both the
+        # per-element tolist() conversion and FastAPI's jsonable_encoder
+        return ORJSONResponse({
             "success": True,
-            "analysis": {
-                "risk_reward": {
-                    "max_profit": round(max_profit, 2),
-                    "max_loss": round(max_loss, 2),
-                    "return_on_risk_percent": round(return_on_risk, 2),
-                    "risk_reward_ratio": round(max_profit / max_loss, 3) if max_loss > 0 else 0,
-                    "net_credit": round(net_credit, 2)
-                },
-                "breakevens": {
-                    "upper": round(upper_breakeven, 2),
-                    "lower": round(lower_breakeven, 2),
-                    "range": round(upper_breakeven - lower_breakeven, 2),
-                    "range_percent": round((upper_breakeven - lower_breakeven) / current_price * 100, 2)
-                },
-                "probability": {
-                    "profit_percent": round(probability_of_profit, 2),
-                    "loss_percent": round(100 - probability_of_profit, 2),
-                    "short_call_itm_percent": round(prob_short_call_itm, 2),
-                    "short_put_itm_percent": round(prob_short_put_itm, 2),
-                    "method": "black_scholes_normal_distribution"
-                },
-                "sensitivity": {
-                    "upside_room_percent": round(upside_room, 2),
-                    "downside_room_percent": round(downside_room, 2),
-                    "days_to_expiration": days_to_expiration,
-                    "implied_volatility": sigma,
-                    "current_price": current_price
-                },
-                "recommendations": {
-                    "optimal_long_call_strike": optimal_strikes['long_call'],
-                    "optimal_short_call_strike": optimal_strikes['short_call'],
-                    "optimal_short_put_strike": optimal_strikes['short_put'],
-                    "optimal_long_put_strike": optimal_strikes['long_put'],
-                    "reasoning": f"Strikes optimized for ~70% probability of profit based on {sigma:.0%} IV"
-                },
-                "quality_metrics": {
-                    "score": score,
-                    "rating": rating,
-                    "factors": {
-                        "return_on_risk": "Good" if return_on_risk > 20 else "Fair" if return_on_risk > 10 else "Poor",
-                        "probability_of_profit": "Good" if probability_of_profit > 65 else "Fair" if probability_of_profit > 50 else "Poor",
-                        "time_to_expiration": "Optimal" if 30 <= days_to_expiration <= 45 else "Acceptable" if days_to_expiration > 20 else "Risky"
-                    }
-                },
-                "payoff_profile": payoff_profile
+            "grid": {
+                "current_prices": request.current_prices,
+                "implied_volatilities": request.implied_volatilities,
+                "net_credit": np.round(net_credit, 2),
+                "max_profit": np.round(net_credit, 2),
+                "max_loss": np.round(max_loss, 2),
+                "upper_breakeven": np.round(upper_breakeven, 2),
+                "lower_breakeven": np.round(lower_breakeven, 2),
+                "probability_of_profit": np.round(probability_of_profit, 2)
             },
-            "timestamp": datetime.now().isoformat()
-        }
+            "days_to_expiration": days_to_expiration,
+            "timestamp": _now_iso()
+        })
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
     except Exception as e:
-        logger.error(f"Iron condor analysis failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+        logger.error(f"Batch analysis failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Batch analysis failed: {str(e)}")
 
 @app.post("/iron-condor/greeks")
 async def calculate_iron_condor_greeks(request: IronCondorGreeksRequest):
@@ -634,67 +1500,28 @@ async def calculate_iron_condor_greeks(request: IronCondorGreeksRequest):
         Portfolio-level Greeks, individual leg breakdown, risk profile, and interpretations
     """
     try:
-        lc = request.long_call_greeks
-        sc = request.short_call_greeks
-        sp = request.short_put_greeks
-        lp = request.long_put_greeks
         contracts = request.contracts
-        
-        # Calculate net Greeks (long = negative, short = positive)
-        portfolio_delta = (
-            -lc.get('delta', 0) +
-            sc.get('delta', 0) +
-            sp.get('delta', 0) +
-            -lp.get('delta', 0)
-        ) * contracts * 100
-        
-        portfolio_gamma = (
-            -lc.get('gamma', 0) +
-            sc.get('gamma', 0) +
-            sp.get('gamma', 0) +
-            -lp.get('gamma', 0)
-        ) * contracts * 100
-        
-        portfolio_theta = (
-            -lc.get('theta', 0) +
-            sc.get('theta', 0) +
-            sp.get('theta', 0) +
-            -lp.get('theta', 0)
-        ) * contracts * 100
-        
-        portfolio_vega = (
-            -lc.get('vega', 0) +
-            sc.get('vega', 0) +
-            sp.get('vega', 0) +
-            -lp.get('vega', 0)
-        ) * contracts * 100
-        
+        greek_names = ('delta', 'gamma', 'theta', 'vega')
+        leg_names = ('long_call', 'short_call', 'short_put', 'long_put')
+
+        # Rows = legs, cols = delta/gamma/theta/vega; long legs contribute
+        # with negative sign, short legs with positive sign
+        legs = np.array([
+            [leg.get(g, 0) for g in greek_names]
+            for leg in (request.long_call_greeks, request.short_call_greeks,
+                        request.short_put_greeks, request.long_put_greeks)
+        ])
+        signs = np.array([-1.0, 1.0, 1.0, -1.0])
+
+        leg_contrib = np.round(signs[:, None] * legs * contracts * 100, 4)
+        # Signed column sums as one matvec
+        portfolio_delta, portfolio_gamma, portfolio_theta, portfolio_vega = (
+            (signs @ legs * contracts * 100).tolist())
+
         # Individual leg contributions
         legs_breakdown = {
-            "long_call": {
-                "delta": round(-lc.get('delta', 0) * contracts * 100, 4),
-                "gamma": round(-lc.get('gamma', 0) * contracts * 100, 4),
-                "theta": round(-lc.get('theta', 0) * contracts * 100, 4),
-                "vega": round(-lc.get('vega', 0) * contracts * 100, 4)
-            },
-            "short_call": {
-                "delta": round(sc.get('delta', 0) * contracts * 100, 4),
-                "gamma": round(sc.get('gamma', 0) * contracts * 100, 4),
-                "theta": round(sc.get('theta', 0) * contracts * 100, 4),
-                "vega": round(sc.get('vega', 0) * contracts * 100, 4)
-            },
-            "short_put": {
-                "delta": round(sp.get('delta', 0) * contracts * 100, 4),
-                "gamma": round(sp.get('gamma', 0) * contracts * 100, 4),
-                "theta": round(sp.get('theta', 0) * contracts * 100, 4),
-                "vega": round(sp.get('vega', 0) * contracts * 100, 4)
-            },
-            "long_put": {
-                "delta": round(-lp.get('delta', 0) * contracts * 100, 4),
-                "gamma": round(-lp.get('gamma', 0) * contracts * 100, 4),
-                "theta": round(-lp.get('theta', 0) * contracts * 100, 4),
-                "vega": round(-lp.get('vega', 0) * contracts * 100, 4)
-            }
+            leg: dict(zip(greek_names, row.tolist()))
+            for leg, row in zip(leg_names, leg_contrib)
         }
         
         # Risk interpretation
@@ -730,7 +1557,7 @@ async def calculate_iron_condor_greeks(request: IronCondorGreeksRequest):
                 "vega": "Position benefits from decreasing volatility" if risk_profile["negative_vega"] else "Position benefits from increasing volatility",
                 "gamma": f"Gamma risk is {risk_profile['gamma_risk']}"
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     except Exception as e:
         logger.error(f"Greeks calculation failed: {str(e)}")
@@ -752,34 +1579,38 @@ async def optimize_iron_condor(request: IronCondorOptimizationRequest):
         if T <= 0:
             raise HTTPException(status_code=400, detail="Expiration must be in future")
         
-        # Optimize strikes
-        optimal_strikes = optimize_iron_condor_strikes(
-            request.current_price,
-            T,
-            request.implied_volatility,
-            request.target_probability,
-            request.wing_width
-        )
-        
-        # Calculate expected metrics with optimal strikes
-        analysis_request = IronCondorAnalysisRequest(
-            symbol=request.symbol,
-            expiration_date=request.expiration_date,
-            long_call_strike=optimal_strikes['long_call'],
-            short_call_strike=optimal_strikes['short_call'],
-            short_put_strike=optimal_strikes['short_put'],
-            long_put_strike=optimal_strikes['long_put'],
-            contracts=request.contracts,
-            current_price=request.current_price,
-            implied_volatility=request.implied_volatility
-        )
-        
-        analysis = await analyze_iron_condor(analysis_request)
-        
+        # The strike scan plus full analysis is the heaviest sync block
+        # left in a handler; run it on a worker thread so concurrent
+        # requests are not serialized behind it on the event loop
+        def compute():
+            optimal = optimize_iron_condor_strikes(
+                request.current_price,
+                T,
+                request.implied_volatility,
+                request.target_probability,
+                request.wing_width
+            )
+            # Calling the core directly skips a redundant pydantic model
+            # build + validation
+            performance = _analyze_iron_condor_core(
+                request.symbol,
+                request.expiration_date,
+                optimal['long_call'],
+                optimal['short_call'],
+                optimal['short_put'],
+                optimal['long_put'],
+                contracts=request.contracts,
+                current_price=request.current_price,
+                implied_volatility=request.implied_volatility
+            )
+            return optimal, performance
+
+        optimal_strikes, expected_performance = await asyncio.to_thread(compute)
+
         return {
             "success": True,
             "optimal_strikes": optimal_strikes,
-            "expected_performance": analysis["analysis"],
+            "expected_performance": expected_performance,
             "optimization_parameters": {
                 "target_probability": request.target_probability,
                 "wing_width": request.wing_width,
@@ -787,7 +1618,7 @@ async def optimize_iron_condor(request: IronCondorOptimizationRequest):
                 "implied_volatility": request.implied_volatility,
                 "days_to_expiration": days_to_expiration
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     except Exception as e:
         logger.error(f"Optimization failed: {str(e)}")
@@ -809,9 +1640,11 @@ async def monitor_position(request: PositionMonitorRequest):
         # Calculate current metrics (placeholder - use real market data)
         current_price = request.market_data.get('price', 4500.0) if hasattr(request, 'market_data') else 4500.0
         
-        # Calculate current P&L
+        # Calculate current P&L with the strike-specialized payoff closure
         strikes = request.strikes
-        current_pnl = calculate_iron_condor_payoff(current_price, strikes, request.entry_credit)
+        current_pnl = _mk_payoff(strikes['long_put'], strikes['short_put'],
+                                 strikes['short_call'], strikes['long_call'],
+                                 request.entry_credit)(current_price)
         
         # Check for alerts
         alerts = []
@@ -843,47 +1676,127 @@ async def monitor_position(request: PositionMonitorRequest):
             "position_status": {
                 "strategy_id": request.strategy_id,
                 "current_price": current_price,
-                "current_pnl": round(current_pnl, 2),
-                "pnl_percent": round(pnl_percent, 2),
+                "current_pnl": round(float(current_pnl), 2),
+                "pnl_percent": round(float(pnl_percent), 2),
                 "days_to_expiration": days_to_expiration,
                 "entry_credit": request.entry_credit
             },
             "alerts": alerts,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     except Exception as e:
         logger.error(f"Position monitoring failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Monitoring failed: {str(e)}")
 
+@app.post("/iron-condor/payoff-curve")
+async def payoff_curve(request: PayoffCurveRequest):
+    """
+    Evaluate iron condor P&L over a grid of underlying prices
+
+    Accepts an explicit price grid, or builds one spanning the wings when
+    none is given. The grid is evaluated in a single compiled pass.
+
+    Returns:
+        Price grid and the P&L at each point
+    """
+    try:
+        strikes = request.strikes
+        lc = strikes['long_call']
+        sc = strikes['short_call']
+        sp = strikes['short_put']
+        lp = strikes['long_put']
+
+        if request.prices:
+            prices = np.asarray(request.prices, dtype=np.float64)
+        else:
+            prices = np.linspace(lp * 0.9, lc * 1.1, request.points)
+
+        def evaluate():
+            if NUMBA_AVAILABLE:
+                return ic_payoff_vec(prices, lp, sp, sc, lc, request.net_credit)
+            return ic_payoff_grid(prices, lp, sp, sc, lc, request.net_credit)
+
+        if len(prices) > 1000:
+            # Big grids run off the event loop; the kernels release the GIL
+            pnl = await asyncio.to_thread(evaluate)
+        else:
+            pnl = evaluate()
+
+        # orjson serializes the arrays natively; no tolist()/jsonable_encoder
+        return ORJSONResponse({
+            "success": True,
+            "prices": np.round(prices, 2),
+            "pnl": np.round(pnl, 2),
+            "points": len(prices),
+            "timestamp": _now_iso()
+        })
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"Missing strike: {str(e)}")
+    except Exception as e:
+        logger.error(f"Payoff curve calculation failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Payoff curve failed: {str(e)}")
+
+def _build_position_updates(positions: List[Dict[str, Any]],
+                            market_data: Dict[str, float], now: str) -> List[Dict[str, Any]]:
+    """Struct-of-arrays update pass over one chunk of positions.
+
+    Pulls the columns out once and stamps a single shared timestamp;
+    module-level (and argument-pickleable) so the process pool can run
+    chunks of a large batch in parallel.
+    """
+    ids = [p.get('id') for p in positions]
+    symbols = [p.get('symbol') for p in positions]
+    entries = np.fromiter(
+        (p.get('entry_price', 4500) for p in positions),
+        dtype=np.float64, count=len(positions))
+    prices = np.fromiter(
+        (market_data.get(s, e) for s, e in zip(symbols, entries)),
+        dtype=np.float64, count=len(positions))
+
+    return [
+        {
+            "position_id": ids[i],
+            "symbol": symbols[i],
+            "current_price": float(prices[i]),
+            "updated_at": now
+        }
+        for i in range(len(positions))
+    ]
+
 @app.post("/iron-condor/batch-update")
-async def batch_update_positions(request: RealTimeUpdateRequest):
+async def batch_update_positions(request: Request):
     """
     Batch update multiple iron condor positions with real-time data
-    
+
     Returns:
         Updated metrics for all positions
     """
+    payload = await _decode_body(request, _BATCH_UPDATE_DECODER)
     try:
-        updates = []
-        
-        for position in request.positions:
-            # Calculate current metrics for each position
-            current_price = request.market_data.get(position['symbol'], position.get('entry_price', 4500))
-            
-            # This is a simplified example - implement full logic as needed
-            update = {
-                "position_id": position.get('id'),
-                "symbol": position.get('symbol'),
-                "current_price": current_price,
-                "updated_at": datetime.now().isoformat()
-            }
-            updates.append(update)
-        
+        positions = payload.positions
+        market_data = payload.market_data
+        now = _now_iso()
+
+        if _POOL is not None and len(positions) > _POOL_FANOUT_THRESHOLD:
+            # Big batch: split across the process pool and stitch the
+            # chunk results back together in order
+            loop = asyncio.get_running_loop()
+            n_chunks = os.cpu_count() or 1
+            size = -(-len(positions) // n_chunks)
+            parts = await asyncio.gather(*[
+                loop.run_in_executor(_POOL, _build_position_updates,
+                                     positions[i:i + size], market_data, now)
+                for i in range(0, len(positions), size)
+            ])
+            updates = [u for part in parts for u in part]
+        else:
+            updates = _build_position_updates(positions, market_data, now)
+
         return {
             "success": True,
             "updates": updates,
             "total_updated": len(updates),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         }
     except Exception as e:
         logger.error(f"Batch update failed: {str(e)}")
@@ -893,4 +1806,12 @@ async def batch_update_positions(request: RealTimeUpdateRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    # uvloop + httptools (bundled with uvicorn[standard]) roughly double
+    # request throughput on the small JSON endpoints vs the default
+    # selector loop and h11 parser. One worker per core (minus one for the
+    # OS) scales past a single core; the app is passed as an import string
+    # because multi-worker mode re-imports it per process. Access logs are
+    # disabled — they serialize request handling at high RPS.
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, log_level="info",
+                workers=max(1, (os.cpu_count() or 1) - 1),
+                loop="uvloop", http="httptools", access_log=False)